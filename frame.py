@@ -1,12 +1,18 @@
+from __future__ import annotations
+
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
-
-import numpy as np
+from typing import TYPE_CHECKING
 
 import frame_defs
 import prach
 import riv
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 @dataclass
 class SCS_SpecificCarrier:
@@ -88,8 +94,78 @@ class FrameConfig:
         self.frame_type = frame_type
 
 def generate_empty_sfn(cfg : FrameConfig) -> np.ndarray:
+    # NumPy is imported lazily, see prach.generate_prach
+    import numpy as np  # pylint: disable=import-outside-toplevel
     logging.debug('Generating an empty sfn. Frame type: %s, number of RBs: %d, subcarrier spacing: %s',
                   cfg.frame_type, cfg.N_size_mu_not_grid, cfg.mu_not)
     N_subframe_slot = 1 << cfg.mu_not.value
     total_number_of_symbols = frame_defs.N_slot_symb * N_subframe_slot * frame_defs.NUMBER_SUBFRAMES_PER_SFN
-    return np.ndarray((cfg.fft_size, total_number_of_symbols), dtype = np.complex64)
+    return np.zeros((cfg.fft_size, total_number_of_symbols), dtype = np.complex64)
+
+@contextmanager
+def _writeable(*arrays : np.ndarray) -> Iterator[None]:
+    for array in arrays:
+        array.flags.writeable = True
+    try:
+        yield
+    finally:
+        for array in arrays:
+            array.flags.writeable = False
+
+class ResourceGrid:
+    # The underlying arrays stay non-writeable outside of write(), mark_dirty() and modulate(),
+    # so the views handed out cannot be turned writeable again and bypass the dirty tracking
+    _sfn : np.ndarray
+    _time_domain : np.ndarray
+    _dirty_slots : np.ndarray
+
+    def __init__(self, cfg : FrameConfig):
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        self._sfn = generate_empty_sfn(cfg)
+        self._time_domain = np.zeros_like(self._sfn)
+        number_of_slots = self._sfn.shape[1] // frame_defs.N_slot_symb
+        # Nothing has been modulated yet, hence every slot starts dirty
+        self._dirty_slots = np.ones(number_of_slots, dtype = bool)
+        for array in (self._sfn, self._time_domain, self._dirty_slots):
+            array.flags.writeable = False
+
+    @property
+    def sfn(self) -> np.ndarray:
+        return self._sfn.view()
+
+    @property
+    def time_domain(self) -> np.ndarray:
+        return self._time_domain.view()
+
+    @property
+    def dirty_slots(self) -> np.ndarray:
+        return self._dirty_slots.view()
+
+    def mark_dirty(self, first_symbol : int, number_of_symbols : int = 1) -> None:
+        assert number_of_symbols > 0, f'Number of symbols ({number_of_symbols}) has to be positive'
+        assert 0 <= first_symbol and first_symbol + number_of_symbols <= self._sfn.shape[1], f'Symbols ({first_symbol}, {first_symbol + number_of_symbols}) outside the grid (0, {self._sfn.shape[1]})'
+        first_slot = first_symbol // frame_defs.N_slot_symb
+        last_slot = (first_symbol + number_of_symbols - 1) // frame_defs.N_slot_symb
+        with _writeable(self._dirty_slots):
+            self._dirty_slots[first_slot:last_slot + 1] = True
+
+    def write(self, first_subcarrier : int, first_symbol : int, values : np.ndarray) -> None:
+        assert values.ndim == 2, f'Expected 2D array (subcarriers, symbols), got {values.ndim}D'
+        number_of_subcarriers, number_of_symbols = values.shape
+        assert 0 <= first_subcarrier and first_subcarrier + number_of_subcarriers <= self._sfn.shape[0], f'Subcarriers ({first_subcarrier}, {first_subcarrier + number_of_subcarriers}) outside the grid (0, {self._sfn.shape[0]})'
+        self.mark_dirty(first_symbol, number_of_symbols)
+        with _writeable(self._sfn):
+            self._sfn[first_subcarrier:first_subcarrier + number_of_subcarriers, first_symbol:first_symbol + number_of_symbols] = values
+
+    def modulate(self) -> np.ndarray:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        # Only slots touched since the previous pass are transformed, the remaining ones are reused from the cache
+        dirty = np.flatnonzero(self._dirty_slots)
+        logging.debug('Modulating %u out of %u slots', len(dirty), len(self._dirty_slots))
+        with _writeable(self._time_domain, self._dirty_slots):
+            for slot in dirty:
+                symbols = slice(slot * frame_defs.N_slot_symb, (slot + 1) * frame_defs.N_slot_symb)
+                self._time_domain[:, symbols] = np.fft.ifft(self._sfn[:, symbols], axis = 0)
+            self._dirty_slots[:] = False
+        return self.time_domain
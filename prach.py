@@ -1,11 +1,15 @@
+from __future__ import annotations
+
 import logging
 from dataclasses import dataclass
 from enum import Enum
-
-import numpy as np
+from typing import TYPE_CHECKING
 
 import frame_defs
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class PrachConfigurationIndex(Enum):
     CONFIGURATION_INDEX_0  = 0
@@ -224,6 +228,8 @@ __PrachConfigurationIndex : dict[frame_defs.FrameType, dict[PrachConfigurationIn
 __PrachConfigurationIndex_TD : dict[frame_defs.FrameType, dict[PrachConfigurationIndex, dict[str, int]]] = {frame_defs.FrameType.FDD: __PrachConfigurationIndex_FDD_TD, frame_defs.FrameType.TDD: __PrachConfigurationIndex_TDD_TD}
 
 def generate_prach(frame_type : frame_defs.FrameType, rach_ConfigCommon : RACH_ConfigCommon) -> np.ndarray:
+    # NumPy dominates the import time, so it is only loaded once a sequence is actually generated
+    import numpy as np  # pylint: disable=import-outside-toplevel
     assert rach_ConfigCommon.restrictedSetConfig == PrachRestrictedSet.UNRESTRICTED_SET, 'Only unrestricted set is supported'
 
     preamble_id = np.random.randint(0, rach_ConfigCommon.totalNumberOfRA_Preambles)
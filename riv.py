@@ -1,4 +1,4 @@
-import numpy as np
+import math
 
 
 def calculate_offset_and_bandwidth(riv : int, N_size_BWP: int) -> tuple[int, int]:
@@ -12,7 +12,7 @@ def calculate_offset_and_bandwidth(riv : int, N_size_BWP: int) -> tuple[int, int
     return (offset, bandwidth)
 
 def calculate_riv(RB_start : int, L_RBs : int, N_size_BWP : int) -> int:
-    if (L_RBs - 1) < np.ceil(N_size_BWP / 2):
+    if (L_RBs - 1) < math.ceil(N_size_BWP / 2):
         riv = N_size_BWP * (L_RBs - 1) + RB_start
     else:
         riv = N_size_BWP * (N_size_BWP - L_RBs + 1) + (N_size_BWP - 1 - RB_start)
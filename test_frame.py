@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 import frame
@@ -130,3 +131,87 @@ class TestFrame:
             _bwp = frame.BWP(37950, frame_defs.SubcarrierSpacing.kHz30)
 
         _bwp = frame.BWP(1099, frame_defs.SubcarrierSpacing.kHz30)
+
+    @staticmethod
+    def __construct_small_grid() -> frame.ResourceGrid:
+        scs_SpecificCarrier = frame.SCS_SpecificCarrier(0, frame_defs.SubcarrierSpacing.kHz15, 11)
+        frequencyInfoUL = frame.FrequencyInfoUL([scs_SpecificCarrier])
+        bwp = frame.BWP(2750, frame_defs.SubcarrierSpacing.kHz15, frame_defs.CyclicPrefix.NORMAL)
+        bwp_uplinkCommon = frame.BWP_UplinkCommon(bwp, prach.RACH_ConfigCommon())
+        uplinkConfigCommon = frame.UplinkConfigCommon(frequencyInfoUL, bwp_uplinkCommon)
+        return frame.ResourceGrid(frame.FrameConfig(uplinkConfigCommon))
+
+    def test_resource_grid_initially_dirty(self) -> None:
+        grid = self.__construct_small_grid()
+        assert grid.sfn.shape         == (256, 14 * 1024)
+        assert grid.time_domain.shape == grid.sfn.shape
+        assert len(grid.dirty_slots)  == 1024
+        assert grid.dirty_slots.all()
+
+        grid.modulate()
+        assert not grid.dirty_slots.any()
+
+    def test_resource_grid_write_marks_dirty_slots(self) -> None:
+        grid = self.__construct_small_grid()
+        grid.modulate()
+
+        grid.write(12, 26, np.ones((24, 4), dtype = np.complex64))
+        assert list(np.flatnonzero(grid.dirty_slots)) == [1, 2]
+
+        grid.mark_dirty(14 * 100)
+        assert list(np.flatnonzero(grid.dirty_slots)) == [1, 2, 100]
+
+    def test_resource_grid_write_out_of_bounds(self) -> None:
+        grid = self.__construct_small_grid()
+        with pytest.raises(AssertionError):
+            grid.write(250, 0, np.ones((12, 1), dtype = np.complex64))
+
+        with pytest.raises(AssertionError):
+            grid.write(0, 14 * 1024 - 1, np.ones((12, 2), dtype = np.complex64))
+
+    def test_resource_grid_read_only(self) -> None:
+        grid = self.__construct_small_grid()
+        time_domain = grid.modulate()
+        with pytest.raises(ValueError):
+            time_domain[:, 0] = 42
+
+        with pytest.raises(ValueError):
+            grid.sfn[0, 0] = 42
+
+        with pytest.raises(ValueError):
+            grid.dirty_slots[0] = True
+
+        with pytest.raises(ValueError):
+            time_domain.flags.writeable = True
+
+        with pytest.raises(ValueError):
+            grid.sfn.flags.writeable = True
+
+        grid.write(0, 0, np.ones((12, 1), dtype = np.complex64))
+        assert not grid.sfn.flags.writeable
+        assert grid.dirty_slots[0]
+
+    def test_resource_grid_incremental_modulation(self, monkeypatch : pytest.MonkeyPatch) -> None:
+        grid = self.__construct_small_grid()
+        grid.write(0, 0, np.ones((12, 14), dtype = np.complex64))
+        grid.modulate()
+
+        values = np.exp(1.0j * np.arange(36 * 3)).reshape(36, 3).astype(np.complex64)
+        grid.write(24, 15, values)
+        grid.mark_dirty(14 * 5)
+
+        assert list(np.flatnonzero(grid.dirty_slots)) == [1, 5]
+
+        transformed_slots = []
+        ifft = np.fft.ifft
+        def ifft_spy(slot : np.ndarray, axis : int) -> np.ndarray:
+            transformed_slots.append(slot)
+            return ifft(slot, axis = axis)
+        monkeypatch.setattr(np.fft, 'ifft', ifft_spy)
+        time_domain = grid.modulate()
+        monkeypatch.undo()
+
+        # Clean slots are served from the cache, only the two dirty ones are transformed again
+        assert len(transformed_slots) == 2
+        np.testing.assert_allclose(time_domain[:, 14:28], np.fft.ifft(grid.sfn[:, 14:28], axis = 0), atol = 1e-6)
+        np.testing.assert_allclose(time_domain[:, 0:14], np.fft.ifft(grid.sfn[:, 0:14], axis = 0), atol = 1e-6)
@@ -0,0 +1,46 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Standard library modules the repo imports. They are loaded first in the same interpreter, so their import time
+# serves as a baseline for how fast the host is and is not charged to the repo modules themselves.
+STDLIB_BASELINE = ('collections.abc', 'contextlib', 'dataclasses', 'enum', 'logging', 'math', 'typing')
+
+# Cumulative import time of each repo module (stdlib already loaded) as a fraction of the stdlib baseline, best of 3 runs.
+# Measured ratios (8 runs each, `python -X importtime`) on CPython 3.11 / 3.12: frame_defs 0.048 / 0.045,
+# riv 0.016 / 0.019, prach 0.31 / 0.26, frame 0.50 / 0.46. The budgets allow roughly twice that.
+# For reference NumPy alone costs about 1.5 baselines, it is caught separately by test_numpy_not_imported.
+IMPORT_TIME_BUDGET = {
+    'frame_defs': 0.10,
+    'riv':        0.05,
+    'prach':      0.60,
+    'frame':      1.00,
+}
+
+def measure_import(module : str) -> tuple[float, bool]:
+    code = f'import {", ".join(STDLIB_BASELINE)}; import sys; import {module}; print("numpy" in sys.modules)'
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output = True, text = True, check = True,
+                            cwd = os.path.dirname(os.path.abspath(__file__)))
+    # Only top level imports, nested ones are already accounted for in the cumulative time of their parent
+    cumulative = {}
+    for line in result.stderr.splitlines()[1:]:
+        _self, cumulative_us, name = line.split('|')
+        if not name.startswith('  '):
+            cumulative[name.strip()] = int(cumulative_us)
+    baseline = sum(cumulative.get(stdlib_module, 0) for stdlib_module in STDLIB_BASELINE)
+    return (cumulative[module] / baseline, result.stdout.strip() == 'True')
+
+class TestImportTime:
+
+    @pytest.mark.parametrize('module', IMPORT_TIME_BUDGET)
+    def test_numpy_not_imported(self, module : str) -> None:
+        _ratio, numpy_imported = measure_import(module)
+        assert not numpy_imported
+
+    @pytest.mark.parametrize('module', IMPORT_TIME_BUDGET)
+    def test_import_time_budget(self, module : str) -> None:
+        # Best of a few runs, the first one may still have to compile the bytecode
+        ratio = min(measure_import(module)[0] for _ in range(3))
+        assert ratio <= IMPORT_TIME_BUDGET[module], f'Importing {module} took {ratio:.3f} of the stdlib baseline, budget is {IMPORT_TIME_BUDGET[module]}'